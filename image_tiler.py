@@ -5,10 +5,17 @@ output a single PDF ready for printing.
 
 Requirements:
   pip install Pillow reportlab
+
+For faster resizing, Pillow-SIMD is a drop-in replacement for Pillow
+(same API, SSE4/AVX2 resampling) and needs no code changes:
+  pip uninstall Pillow
+  CC="cc -mavx2" pip install pillow-simd
 """
 
-import math
 import io
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
@@ -23,6 +30,13 @@ ORIENTATION     = "landscape"         # "portrait" or "landscape"
 MARGIN_IN       = 0                   # margin on each side in inches
 NUM_SHEETS_WIDE = 3                   # pages across
 NUM_SHEETS_HIGH = 2                   # pages tall; set to None to auto-calc
+RESAMPLE        = Image.LANCZOS       # resampling filter for the resize
+NEAR_RESAMPLE   = Image.BICUBIC       # cheaper filter for near-1:1 resizes
+NEAR_SCALE_TOL  = 0.02                # max relative size change for NEAR_RESAMPLE
+JPEG_QUALITY    = 90                  # JPEG quality for opaque tiles; None for lossless
+RESIZE_THREADS  = None                # threads for resizing; None uses all CPUs
+ENCODE_THREADS  = None                # JPEG encode threads/tiles in flight; None uses 2, 1 disables overlap
+REDUCING_GAP    = 3.0                 # box-reduce first when shrinking by > 2× this; None to disable
 # ────────────────────────────────────────────────────────────────────────────
 
 # apply orientation
@@ -40,13 +54,13 @@ def calculate_sheet_counts(img_w, img_h, tile_w_px, tile_h_px):
     if NUM_SHEETS_WIDE and not NUM_SHEETS_HIGH:
         full_w  = tile_w_px * NUM_SHEETS_WIDE
         full_h  = int(img_h / img_w * full_w)
-        sheets_h = math.ceil(full_h / tile_h_px)
+        sheets_h = -(-full_h // tile_h_px)
         return NUM_SHEETS_WIDE, sheets_h, full_w, full_h
 
     if NUM_SHEETS_HIGH and not NUM_SHEETS_WIDE:
         full_h  = tile_h_px * NUM_SHEETS_HIGH
         full_w  = int(img_w / img_h * full_h)
-        sheets_w = math.ceil(full_w / tile_w_px)
+        sheets_w = -(-full_w // tile_w_px)
         return sheets_w, NUM_SHEETS_HIGH, full_w, full_h
 
     if NUM_SHEETS_WIDE and NUM_SHEETS_HIGH:
@@ -56,26 +70,184 @@ def calculate_sheet_counts(img_w, img_h, tile_w_px, tile_h_px):
 
     raise ValueError("Set at least one of NUM_SHEETS_WIDE or NUM_SHEETS_HIGH")
 
-def crop_tiles(image, sheets_w, sheets_h, tile_w_px, tile_h_px):
+def available_cpus():
+    """
+    Number of CPUs this process is allowed to run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def resize_strip(image, src_size, full_w, full_h, top, bottom, resample):
+    """
+    Resize the src_size area of the source to (full_w, full_h) but
+    render only output rows top..bottom. Filter taps still read source
+    pixels outside the strip, so adjacent strips join seamlessly.
+    """
+    src_w, src_h = src_size
+    scale = src_h / full_h
+    box = (0, top * scale, src_w, bottom * scale)
+    return image.resize((full_w, bottom - top), resample, box=box)
+
+def resize_bands(image, full_w, full_h, band_h):
+    """
+    Resize the source to (full_w, full_h) one band of band_h rows at
+    a time, each rendered as strips on RESIZE_THREADS threads.
+    Takes ownership of the source and closes it once it is unneeded,
+    so peak memory is about the source plus one band (briefly twice
+    the source while RGBA/LA alpha is premultiplied).
+    Yields PIL Image bands from top to bottom.
+    """
+    img_w, img_h = image.size
+    if (full_w, full_h) == (img_w, img_h):
+        for top in range(0, full_h, band_h):
+            bottom = min(top + band_h, full_h)
+            band = image.crop((0, top, full_w, bottom))
+            if bottom == full_h:
+                image.close()
+            yield band
+        return
+
+    # near 1:1 the cheaper NEAR_RESAMPLE filter is good enough
+    resample = RESAMPLE
+    if (abs(full_w - img_w) / img_w < NEAR_SCALE_TOL
+            and abs(full_h - img_h) / img_h < NEAR_SCALE_TOL):
+        resample = NEAR_RESAMPLE
+
+    # Pillow premultiplies alpha on every resize() call, over the whole
+    # source regardless of box; do it once here and undo it per band
+    mode = image.mode
+    if mode in ("LA", "RGBA"):
+        premultiplied = image.convert(mode[:-1] + "a")
+        image.close()
+        image = premultiplied
+
+    # box-reduce large downscales first, leaving at least REDUCING_GAP×
+    # the target size for the final filter
+    src_size = (img_w, img_h)
+    if REDUCING_GAP and image.mode not in ("1", "P"):
+        factor_x = max(1, int(img_w / full_w / REDUCING_GAP))
+        factor_y = max(1, int(img_h / full_h / REDUCING_GAP))
+        if factor_x > 1 or factor_y > 1:
+            reduced = image.reduce((factor_x, factor_y))
+            image.close()
+            image = reduced
+            # the last block of a partial reduce covers less than a full
+            # pixel, so keep the true extents rather than the rounded size
+            src_size = (img_w / factor_x, img_h / factor_y)
+
+    # Pillow releases the GIL while resampling, so strips run in parallel
+    image.load()
+    workers = RESIZE_THREADS or available_cpus()
+    if image.mode in ("1", "P"):
+        workers = 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for top in range(0, full_h, band_h):
+            bottom = min(top + band_h, full_h)
+            count = min(workers, bottom - top)
+            if count == 1:
+                band = resize_strip(image, src_size, full_w, full_h,
+                                    top, bottom, resample)
+            else:
+                bounds = [top + (bottom - top) * i // count
+                          for i in range(count + 1)]
+                band = Image.new(image.mode, (full_w, bottom - top))
+                strips = pool.map(
+                    lambda upper, lower: resize_strip(
+                        image, src_size, full_w, full_h, upper, lower,
+                        resample
+                    ),
+                    bounds[:-1], bounds[1:],
+                )
+                for upper, strip in zip(bounds, strips):
+                    band.paste(strip, (0, upper - top))
+            if band.mode != mode:
+                band = band.convert(mode)
+            if bottom == full_h:
+                image.close()
+            yield band
+
+def crop_tiles(bands, sheets_w, tile_w_px, tile_h_px):
     """
-    Crop the resized image into individual tile images.
-    Returns a list of PIL Image tiles.
+    Crop each resized band (one row of pages) into tile images.
+    Tiles overhanging the image edge are padded with white.
+    Yields PIL Image tiles row by row so only one band is held at a time.
     """
-    tiles = []
-    for row in range(sheets_h):
+    for band in bands:
         for col in range(sheets_w):
             left   = col * tile_w_px
-            upper  = row * tile_h_px
             right  = left + tile_w_px
-            lower  = upper + tile_h_px
-            tile = image.crop((left, upper, right, lower))
-            tiles.append(tile)
-    return tiles
+            if right <= band.width and band.height == tile_h_px:
+                tile = band.crop((left, 0, right, tile_h_px))
+            else:
+                # edge tile overhangs the image: pad with white, not black
+                region = band.crop((left, 0, min(right, band.width),
+                                    band.height))
+                if region.mode in ("1", "P", "PA"):
+                    # a fresh palette canvas would not share the band's
+                    # palette, so pad in a direct-colour mode instead
+                    alpha = region.mode == "PA" or "transparency" in region.info
+                    region = region.convert("RGBA" if alpha else "RGB")
+                white = (0, 0, 0, 0) if region.mode == "CMYK" else "white"
+                tile = Image.new(region.mode, (tile_w_px, tile_h_px), white)
+                tile.paste(region)
+            yield tile
 
-def save_tiles_to_pdf(tiles):
+def is_opaque(tile):
     """
-    Save each tile into a PDF page.
-    Preserves transparency via mask="auto".
+    True if the tile has no transparency and can be embedded as JPEG.
+    """
+    if tile.mode == "RGBA":
+        return tile.getchannel("A").getextrema() == (255, 255)
+    return tile.mode in ("RGB", "L")
+
+def encode_tile(tile):
+    """
+    JPEG-encode an opaque tile for embedding in the PDF.
+    Returns (ImageReader, mask).
+    """
+    if tile.mode == "RGBA":
+        tile = tile.convert("RGB")
+
+    buf = io.BytesIO()
+    tile.save(buf, format="JPEG", quality=JPEG_QUALITY,
+              optimize=False, progressive=False)
+    buf.seek(0)
+    # ReportLab recognises the JPEG and copies these bytes verbatim into
+    # a DCTDecode stream without re-encoding; JPEG has no alpha, so no mask
+    return ImageReader(buf), None
+
+def encode_tiles(tiles, lossless=False):
+    """
+    Yield (ImageReader, mask) for each tile in input order.
+    With lossless set, no tile is JPEG-encoded.
+    Opaque tiles are JPEG-encoded on ENCODE_THREADS threads (default 2),
+    overlapping with cropping and PDF writing; at most that many are in
+    flight, so 1 waits on each encode and gives no overlap.
+    Other tiles stay lossless with mask="auto" and are compressed by
+    drawImage itself.
+    """
+    workers = ENCODE_THREADS or 2
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for tile in tiles:
+            if lossless or JPEG_QUALITY is None or not is_opaque(tile):
+                while pending:
+                    yield pending.popleft().result()
+                yield ImageReader(tile), "auto"
+                continue
+
+            pending.append(pool.submit(encode_tile, tile))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def save_tiles_to_pdf(tiles, lossless=False):
+    """
+    Save each tile from an iterable into a PDF page.
+    With lossless set, every tile is embedded without JPEG.
+    Preserves transparency via mask="auto" on translucent tiles.
     """
     page_w_pt, page_h_pt = (dim * inch for dim in PAGE_SIZE_IN)
     pdf = canvas.Canvas(OUTPUT_PDF, pagesize=(page_w_pt, page_h_pt))
@@ -85,17 +257,13 @@ def save_tiles_to_pdf(tiles):
     offset_x    = MARGIN_IN * inch
     offset_y    = MARGIN_IN * inch
 
-    for tile in tiles:
-        buf = io.BytesIO()
-        tile.save(buf, format="PNG")
-        buf.seek(0)
-        img = ImageReader(buf)
+    for img, mask in encode_tiles(tiles, lossless):
         pdf.drawImage(
             img,
             offset_x, offset_y,
             width=printable_w,
             height=printable_h,
-            mask="auto"
+            mask=mask
         )
         pdf.showPage()
 
@@ -116,15 +284,33 @@ def main():
         img_w, img_h, tile_w_px, tile_h_px
     )
 
-    # resize source to exact full dimensions
-    resized = img.resize((full_w, full_h), Image.LANCZOS)
+    # let libjpeg decode at a reduced DCT scale when the source is larger
+    # than needed; draft() never goes below the requested size
+    if img.format == "JPEG":
+        img.draft("RGB", (full_w, full_h))
+        img_w, img_h = img.size
 
-    print(f"Image resized to {full_w}×{full_h} px")
+    # drop a fully opaque alpha channel so the resize handles 3 channels, not 4
+    if img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255):
+        rgb = img.convert("RGB")
+        img.close()
+        img = rgb
+
+    print(f"Resizing image to {full_w}×{full_h} px")
     print(f"Tiling into {sheets_w}×{sheets_h} pages")
 
-    # crop and export
-    tiles = crop_tiles(resized, sheets_w, sheets_h, tile_w_px, tile_h_px)
-    save_tiles_to_pdf(tiles)
+    # palette and bilevel art stays lossless on every page, including
+    # the edge tiles that crop_tiles converts to RGB for padding
+    lossless = img.mode in ("1", "P", "PA")
+
+    # resize one row of pages at a time, then crop and export its tiles
+    # the band generator owns and closes the source; drop our reference
+    # so its pixel buffer is freed as soon as resizing is done
+    bands = resize_bands(img, full_w, full_h, tile_h_px)
+    del img
+    save_tiles_to_pdf(
+        crop_tiles(bands, sheets_w, tile_w_px, tile_h_px), lossless
+    )
 
 if __name__ == "__main__":
     main()